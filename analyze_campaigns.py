@@ -1,8 +1,31 @@
 import pandas as pd
 import numpy as np
+import argparse
+import functools
 import logging
+import os
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, Tuple
+
+try:
+    import pyarrow
+    HAS_PYARROW = True
+except ImportError:
+    pyarrow = None
+    HAS_PYARROW = False
+
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+try:
+    from numba import njit, prange, types
+except ImportError:
+    njit = None
+
+# Prefer the multithreaded PyArrow parser when it is installed
+CSV_ENGINE = 'pyarrow' if HAS_PYARROW else 'c'
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -13,9 +36,405 @@ REQUIRED_COLUMNS = [
     'CPC (cost per link click)', 'Amount spent (GBP)', 'Results'
 ]
 
+# Column order for the printed result table
+DISPLAY_COLUMNS = [
+    'Campaign name', 'Ad Set Name', 'Ad name', 'Cost per result',
+    'CPC (cost per link click)', 'Results', 'Amount spent (GBP)'
+]
+
+# Per-column cell formatters for the printed result table
+DISPLAY_FORMATTERS = {
+    'Cost per result': '£{:,.2f}'.format,
+    'CPC (cost per link click)': '£{:,.2f}'.format,
+    'Results': '{:,.0f}'.format,
+    'Amount spent (GBP)': '£{:,.2f}'.format
+}
+
+# Rows per chunk when streaming the CSV with explicit thresholds
+CHUNK_SIZE = 200_000
+
+# Rows printed by the script unless --full is given
+DISPLAY_ROWS = 20
+
+NUMERIC_COLUMNS = [
+    'Cost per result', 'CPC (cost per link click)',
+    'Amount spent (GBP)', 'Results'
+]
+
+# Explicit schema for the report so read_csv skips type inference
+COLUMN_DTYPES = {
+    'Campaign name': 'category',
+    'Ad Set Name': 'category',
+    'Ad name': 'category',
+    **{col: 'float32' for col in NUMERIC_COLUMNS}
+}
+
+NAME_COLUMNS = [col for col in REQUIRED_COLUMNS if col not in NUMERIC_COLUMNS]
+
+# Columns the minimum thresholds are computed from
+THRESHOLD_COLUMNS = ['Amount spent (GBP)', 'Results']
+
+def _read_csv_columns(csv_file: str, dtypes: dict) -> pd.DataFrame:
+    """
+    Read just the columns of dtypes from csv_file, typed accordingly.
+    
+    The file is memory-mapped for either parser engine, and parse failures
+    are reported as schema mismatches.
+    
+    Raises:
+        ValueError: If a column is missing or a value doesn't fit its dtype
+    """
+    read_options = {
+        'usecols': list(dtypes),
+        'dtype': dtypes,
+        'engine': CSV_ENGINE
+    }
+    try:
+        if CSV_ENGINE == 'pyarrow':
+            # The pyarrow engine has no memory_map option; give it a mapped file
+            with pyarrow.memory_map(str(csv_file)) as source:
+                return pd.read_csv(source, **read_options)
+        return pd.read_csv(csv_file, memory_map=True, **read_options)
+    except (ValueError, KeyError) as e:
+        # The pyarrow engine reports missing columns as a KeyError
+        raise ValueError(f"Schema mismatch: {e}") from e
+
+def load_campaign_data(csv_file: str) -> pd.DataFrame:
+    """
+    Load the required report columns, preferring a Parquet cache of the CSV.
+    
+    The cache is written next to the CSV on the first read and reused for as
+    long as it is at least as new as the CSV. Caching needs pyarrow and is
+    skipped without it. Within a process, repeated loads of an unchanged
+    file are also served from memory.
+    
+    Args:
+        csv_file: Path to the CSV file containing campaign data
+        
+    Returns:
+        DataFrame holding only REQUIRED_COLUMNS, typed per COLUMN_DTYPES
+        
+    Raises:
+        ValueError: If the CSV does not match the expected schema
+    """
+    # Copy so callers can't modify the cached frame
+    return _cached_campaign_data(csv_file).copy()
+
+def _cached_campaign_data(csv_file: str) -> pd.DataFrame:
+    """Return the shared cached frame for csv_file; it must not be modified."""
+    csv_path = Path(csv_file)
+    return _load_campaign_data(str(csv_path.resolve()), csv_path.stat().st_mtime_ns)
+
+@functools.lru_cache(maxsize=4)
+def _load_campaign_data(csv_file: str, mtime_ns: int) -> pd.DataFrame:
+    """Load csv_file; mtime_ns only keys the cache so edits invalidate it."""
+    csv_path = Path(csv_file)
+    cache_path = csv_path.with_suffix('.parquet')
+    
+    if (HAS_PYARROW and cache_path.is_file()
+            and cache_path.stat().st_mtime >= csv_path.stat().st_mtime):
+        logging.info("Reading Parquet cache: %s", cache_path)
+        try:
+            return pd.read_parquet(cache_path, columns=REQUIRED_COLUMNS)
+        except Exception as e:
+            # An unreadable cache is rebuilt from the CSV below
+            logging.warning("Ignoring unreadable Parquet cache %s: %s", cache_path, e)
+    
+    logging.info("Reading CSV file: %s", csv_file)
+    
+    # Read only the columns we use, with a fixed schema. usecols and dtype
+    # enforce the schema, so missing columns or non-numeric metrics fail
+    # here rather than in a separate validation pass.
+    # Put columns in REQUIRED_COLUMNS order, as the Parquet cache returns them
+    df = _read_csv_columns(csv_file, COLUMN_DTYPES)[REQUIRED_COLUMNS]
+    
+    if HAS_PYARROW:
+        # Write beside the cache and rename into place, so an interrupted
+        # or concurrent run never sees a partially written file
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            df.to_parquet(tmp_path, compression='zstd', index=False)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logging.warning("Could not write Parquet cache %s: %s", cache_path, e)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    
+    return df
+
+# Rows scanned per parallel block by the Numba row-selection kernel
+_KERNEL_BLOCK = 1 << 16
+
+if njit is not None:
+    # Explicit signature so the kernel is compiled (or loaded from cache) at
+    # import rather than on the first call. Inputs are typed read-only since
+    # pandas hands out read-only views of its column buffers.
+    _f4_column = types.Array(types.float32, 1, 'C', readonly=True)
+    
+    @njit(
+        types.int64[::1](_f4_column, _f4_column, types.float32, types.float32),
+        parallel=True,
+        cache=True
+    )
+    def _qualified_rows_kernel(results, spent, min_results, min_spend):
+        # Count qualifying rows per block in parallel, then have each block
+        # write its row positions at its prefix-sum offset
+        n = results.shape[0]
+        n_blocks = (n + _KERNEL_BLOCK - 1) // _KERNEL_BLOCK
+        counts = np.zeros(n_blocks + 1, dtype=np.int64)
+        for block in prange(n_blocks):
+            count = 0
+            for i in range(block * _KERNEL_BLOCK, min(n, (block + 1) * _KERNEL_BLOCK)):
+                if results[i] >= min_results and spent[i] >= min_spend:
+                    count += 1
+            counts[block + 1] = count
+        
+        offsets = np.cumsum(counts)
+        rows = np.empty(offsets[-1], dtype=np.int64)
+        for block in prange(n_blocks):
+            k = offsets[block]
+            for i in range(block * _KERNEL_BLOCK, min(n, (block + 1) * _KERNEL_BLOCK)):
+                if results[i] >= min_results and spent[i] >= min_spend:
+                    rows[k] = i
+                    k += 1
+        return rows
+else:
+    _qualified_rows_kernel = None
+
+def _threshold_mask(
+    results: np.ndarray,
+    spent: np.ndarray,
+    min_results: float,
+    min_spend: float
+) -> np.ndarray:
+    """
+    Build the boolean mask of rows meeting both minimum thresholds.
+    
+    Uses numexpr when available so both comparisons and the AND run in a
+    single pass without intermediate boolean arrays.
+    """
+    if ne is not None:
+        return ne.evaluate(
+            '(results >= min_results) & (spent >= min_spend)',
+            local_dict={
+                'results': results,
+                'spent': spent,
+                'min_results': min_results,
+                'min_spend': min_spend
+            }
+        )
+    return np.greater_equal(results, min_results) & np.greater_equal(spent, min_spend)
+
+def _qualified_rows(
+    results: np.ndarray,
+    spent: np.ndarray,
+    min_results: float,
+    min_spend: float
+) -> np.ndarray:
+    """
+    Return the ascending row positions meeting both minimum thresholds.
+    
+    With Numba the positions are written directly by a parallel kernel,
+    with no boolean mask in between; otherwise the mask is built and
+    converted with np.flatnonzero.
+    
+    The thresholds are cast to float32 up front, so every backend compares
+    in the columns' own precision, as float32 Series comparisons do; a value
+    equal to the threshold is then always kept.
+    """
+    min_results = np.float32(min_results)
+    min_spend = np.float32(min_spend)
+    if _qualified_rows_kernel is not None:
+        return _qualified_rows_kernel(
+            np.ascontiguousarray(results, dtype=np.float32),
+            np.ascontiguousarray(spent, dtype=np.float32),
+            min_results,
+            min_spend
+        )
+    return np.flatnonzero(_threshold_mask(results, spent, min_results, min_spend))
+
+def _percentile(values: np.ndarray, q: float) -> float:
+    """
+    Return the q-th quantile (0-1) of values, ignoring NaNs.
+    
+    The NaNs are dropped and the rest is selected as a single column by
+    _percentiles. Returns NaN when no values remain.
+    """
+    nan_mask = np.isnan(values)
+    if nan_mask.any():
+        values = values[~nan_mask]
+    return float(_percentiles(values[:, None], q)[0])
+
+def _percentiles(values: np.ndarray, q: float) -> np.ndarray:
+    """
+    Return the q-th quantile (0-1) of each column of a 2-D array, ignoring NaNs.
+    
+    Matches Series.quantile's linear interpolation but uses np.partition,
+    an O(n) selection, instead of sorting. Without NaNs every column is
+    selected in a single np.partition call along axis 0. Columns containing NaNs may have different lengths once
+    those are dropped, so they fall back to _percentile one at a time.
+    """
+    if np.isnan(values).any():
+        return np.array([_percentile(column, q) for column in values.T])
+    if values.shape[0] == 0:
+        return np.full(values.shape[1], np.nan)
+    
+    position = (values.shape[0] - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, values.shape[0] - 1)
+    partitioned = np.partition(values, [lower, upper], axis=0)
+    low = partitioned[lower].astype(np.float64)
+    high = partitioned[upper].astype(np.float64)
+    return low + (position - lower) * (high - low)
+
+def _sort_order(
+    cost_per_result: np.ndarray,
+    cpc: np.ndarray,
+    top_k: Optional[int] = None
+) -> np.ndarray:
+    """
+    Return the stable ascending order by cost per result, then CPC.
+    
+    For non-negative float32 values the IEEE-754 bit patterns sort in the
+    same order as the values, so both keys are packed into a single uint64
+    and sorted in one pass. NaNs land last, as with sort_values. Negative
+    values fall back to a two-key lexsort.
+    
+    With top_k, only the first top_k positions of that order are returned.
+    On the packed key they are found by an O(n) partition and only those
+    rows are sorted; ties at the cut-off keep the earliest rows, so the
+    result always equals the head of the full order.
+    """
+    cost_per_result = np.asarray(cost_per_result, dtype=np.float32) + np.float32(0)  # -0.0 -> 0.0
+    cpc = np.asarray(cpc, dtype=np.float32) + np.float32(0)
+    if (cost_per_result < 0).any() or (cpc < 0).any():
+        return np.lexsort((cpc, cost_per_result))[:top_k]
+    
+    key = cost_per_result.view(np.uint32).astype(np.uint64) << np.uint64(32)
+    key |= cpc.view(np.uint32)
+    if top_k is None or top_k >= key.size:
+        return np.argsort(key, kind='stable')
+    
+    cutoff = np.partition(key, top_k - 1)[top_k - 1]
+    below = np.flatnonzero(key < cutoff)
+    ties = np.flatnonzero(key == cutoff)[:top_k - below.size]
+    selected = np.concatenate([below, ties])
+    return selected[np.argsort(key[selected], kind='stable')]
+
+def _percentile_thresholds(
+    values: pd.DataFrame,
+    min_percentile: float
+) -> Tuple[float, float]:
+    """
+    Return (min_spend, min_results) computed from the THRESHOLD_COLUMNS.
+    
+    Uses the min_percentile-th percentile of each column, or half the mean
+    when there are too few rows for a meaningful percentile.
+    """
+    if len(values) >= 5:
+        logging.info("Calculating %sth percentile thresholds", min_percentile)
+        min_spend, min_results = _percentiles(
+            values[THRESHOLD_COLUMNS].to_numpy(), min_percentile/100
+        )
+    else:
+        logging.warning("Insufficient data for percentile calculation, using mean-based thresholds")
+        min_spend, min_results = values[THRESHOLD_COLUMNS].mean() * 0.5
+    return min_spend, min_results
+
+def _load_threshold_columns(csv_file: str) -> pd.DataFrame:
+    """Read only THRESHOLD_COLUMNS from csv_file, for a streaming first pass."""
+    return _read_csv_columns(csv_file, {col: 'float32' for col in THRESHOLD_COLUMNS})
+
+def _metric_value_stats(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return per-column null counts and minimums of the NUMERIC_COLUMNS.
+    
+    Both come from NumPy reductions over one 2-D block; fmin skips NaNs, so
+    empty or all-NaN columns give a minimum of inf without warnings.
+    """
+    numeric = df[NUMERIC_COLUMNS].to_numpy()
+    null_counts = np.isnan(numeric).sum(axis=0)
+    column_mins = np.fmin.reduce(numeric, axis=0, initial=np.inf)
+    return null_counts, column_mins
+
+def _warn_on_metric_values(null_counts: np.ndarray, column_mins: np.ndarray) -> None:
+    """Log a warning for each metric column with negative or null values."""
+    for col, null_count, column_min in zip(NUMERIC_COLUMNS, null_counts, column_mins):
+        if column_min < 0:
+            logging.warning("Negative values found in %s", col)
+        if null_count > 0:
+            logging.warning("Found %d null values in %s", null_count, col)
+
+def load_qualified_campaigns(
+    csv_file: str,
+    min_results: float,
+    min_spend: float,
+    chunksize: int = CHUNK_SIZE
+) -> pd.DataFrame:
+    """
+    Stream the CSV in chunks, keeping only rows that meet both thresholds.
+    
+    Peak memory is bounded by one chunk plus the rows kept, rather than the
+    whole report. The name columns are converted to categories once, after
+    the kept rows are combined. Negative and null metric values are tallied
+    over every chunk and warned about as for a full load.
+    
+    Args:
+        csv_file: Path to the CSV file containing campaign data
+        min_results: Minimum number of results for a campaign to be kept
+        min_spend: Minimum amount spent (GBP) for a campaign to be kept
+        chunksize: Number of rows parsed per chunk
+        
+    Returns:
+        DataFrame holding REQUIRED_COLUMNS for the qualifying rows
+        
+    Raises:
+        ValueError: If the CSV does not match the expected schema
+    """
+    logging.info("Streaming CSV file: %s", csv_file)
+    
+    parts = []
+    null_counts = np.zeros(len(NUMERIC_COLUMNS), dtype=np.int64)
+    column_mins = np.full(len(NUMERIC_COLUMNS), np.inf)
+    try:
+        # The chunked reader needs the C engine
+        chunks = pd.read_csv(
+            csv_file,
+            usecols=REQUIRED_COLUMNS,
+            dtype={col: 'float32' for col in NUMERIC_COLUMNS},
+            engine='c',
+            memory_map=True,
+            chunksize=chunksize
+        )
+        for chunk in chunks:
+            chunk_nulls, chunk_mins = _metric_value_stats(chunk)
+            null_counts += chunk_nulls
+            column_mins = np.fmin(column_mins, chunk_mins)
+            
+            rows = _qualified_rows(
+                chunk['Results'].to_numpy(),
+                chunk['Amount spent (GBP)'].to_numpy(),
+                min_results,
+                min_spend
+            )
+            parts.append(chunk.take(rows))
+    except ValueError as e:
+        raise ValueError(f"Schema mismatch: {e}") from e
+    
+    _warn_on_metric_values(null_counts, column_mins)
+    
+    if not parts:
+        return pd.DataFrame(columns=REQUIRED_COLUMNS).astype(COLUMN_DTYPES)
+    qualified = pd.concat(parts)
+    return qualified[REQUIRED_COLUMNS].astype({col: 'category' for col in NAME_COLUMNS})
+
 def analyze_campaigns(
     csv_file: str,
-    min_percentile: float = 20
+    min_percentile: float = 20,
+    top_k: Optional[int] = None,
+    min_results: Optional[float] = None,
+    min_spend: Optional[float] = None,
+    chunksize: Optional[int] = None
 ) -> Optional[pd.DataFrame]:
     """
     Analyze marketing campaigns by sorting them based on cost efficiency metrics.
@@ -23,101 +442,141 @@ def analyze_campaigns(
     Args:
         csv_file: Path to the CSV file containing campaign data
         min_percentile: Minimum percentile threshold for filtering campaigns (0-100)
+        top_k: If given, only return the top_k most cost-efficient campaigns,
+            avoiding a full sort of the qualified campaigns
+        min_results: Explicit minimum results threshold; must be given together
+            with min_spend and replaces the percentile thresholds. The CSV is
+            then streamed in chunks instead of being loaded whole.
+        min_spend: Explicit minimum amount spent (GBP) threshold
+        chunksize: If given, stream the CSV this many rows at a time, even for
+            percentile thresholds. Those are then computed in a first pass
+            that holds only the two threshold columns in memory.
         
     Returns:
         DataFrame containing sorted and filtered campaigns, or None if validation fails
         
     Raises:
-        ValueError: If min_percentile is not between 0 and 100
+        ValueError: If min_percentile is not between 0 and 100, top_k is not
+            positive, only one of min_results/min_spend is given, or
+            chunksize is not positive
         FileNotFoundError: If the CSV file doesn't exist
     """
     # Validate min_percentile
     if not 0 <= min_percentile <= 100:
         raise ValueError("min_percentile must be between 0 and 100")
     
+    # Validate top_k
+    if top_k is not None and top_k < 1:
+        raise ValueError("top_k must be a positive integer")
+    
+    # Validate explicit thresholds
+    if (min_results is None) != (min_spend is None):
+        raise ValueError("min_results and min_spend must be given together")
+    
+    # Validate chunksize
+    if chunksize is not None and chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+    
     # Check if file exists
     if not Path(csv_file).is_file():
         raise FileNotFoundError(f"CSV file not found: {csv_file}")
     
     try:
-        # Read the CSV file
-        logging.info(f"Reading CSV file: {csv_file}")
-        df = pd.read_csv(csv_file)
-        
-        # Validate required columns
-        missing_cols = [col for col in REQUIRED_COLUMNS if col not in df.columns]
-        if missing_cols:
-            raise ValueError(f"Missing required columns: {missing_cols}")
-        
-        # Convert cost columns to numeric, removing currency symbols if present
-        numeric_columns = ['Cost per result', 'CPC (cost per link click)', 
-                         'Amount spent (GBP)', 'Results']
-        
-        for col in numeric_columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+        if min_results is not None or chunksize is not None:
+            if min_results is None:
+                # First pass over just the threshold columns
+                min_spend, min_results = _percentile_thresholds(
+                    _load_threshold_columns(csv_file), min_percentile
+                )
             
-            # Check for negative values
-            if (df[col] < 0).any():
-                logging.warning(f"Negative values found in {col}")
-                
-            # Check for null values after conversion
-            null_count = df[col].isnull().sum()
-            if null_count > 0:
-                logging.warning(f"Found {null_count} null values in {col}")
-        
-        # Calculate minimum thresholds for spend and results
-        if len(df) >= 5:
-            logging.info(f"Calculating {min_percentile}th percentile thresholds")
-            min_spend = df['Amount spent (GBP)'].quantile(min_percentile/100)
-            min_results = df['Results'].quantile(min_percentile/100)
+            # Thresholds are known up front, so filter while streaming
+            df = load_qualified_campaigns(
+                csv_file, min_results, min_spend, chunksize or CHUNK_SIZE
+            )
+            qualified_rows = np.arange(len(df))
         else:
-            logging.warning("Insufficient data for percentile calculation, using mean-based thresholds")
-            min_spend = df['Amount spent (GBP)'].mean() * 0.5
-            min_results = df['Results'].mean() * 0.5
-        
-        # Filter campaigns with sufficient data
-        qualified_campaigns = df[
-            (df['Amount spent (GBP)'] >= min_spend) & 
-            (df['Results'] >= min_results)
-        ]
+            # Only read from here on, and the result is a fresh take(), so
+            # the cached frame is used without a defensive copy
+            df = _cached_campaign_data(csv_file)
+            
+            # Check for negative and null values across all metric columns
+            _warn_on_metric_values(*_metric_value_stats(df))
+            
+            # Calculate minimum thresholds for spend and results
+            min_spend, min_results = _percentile_thresholds(df, min_percentile)
+            
+            # Filter campaigns with sufficient data, keeping row positions
+            # only so the result frame is materialized once, already sorted
+            qualified_rows = _qualified_rows(
+                df['Results'].to_numpy(),
+                df['Amount spent (GBP)'].to_numpy(),
+                min_results,
+                min_spend
+            )
         
-        if qualified_campaigns.empty:
+        if qualified_rows.size == 0:
             logging.warning("No campaigns met the minimum thresholds")
             return None
         
         # Sort by cost per result first, then by CPC
-        sorted_campaigns = qualified_campaigns.sort_values(
-            by=['Cost per result', 'CPC (cost per link click)']
+        order = _sort_order(
+            df['Cost per result'].to_numpy()[qualified_rows],
+            df['CPC (cost per link click)'].to_numpy()[qualified_rows],
+            top_k
         )
+        sorted_campaigns = df.take(qualified_rows[order])
         
-        logging.info(f"Successfully analyzed {len(sorted_campaigns)} campaigns")
+        logging.info("Successfully analyzed %d campaigns", len(sorted_campaigns))
         return sorted_campaigns
         
     except Exception as e:
-        logging.error(f"Error analyzing campaigns: {str(e)}")
+        logging.error("Error analyzing campaigns: %s", e)
         raise
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Rank campaigns by cost per result and CPC"
+    )
+    parser.add_argument(
+        'csv_file', nargs='?', default='Historic Report CA.csv',
+        help="Path to the campaign report CSV"
+    )
+    parser.add_argument(
+        '--full', action='store_true',
+        help=f"Print every qualified campaign instead of the top {DISPLAY_ROWS}"
+    )
+    parser.add_argument(
+        '--chunksize', type=int, default=None,
+        help="Stream the CSV this many rows at a time to bound memory use"
+    )
+    args = parser.parse_args()
+    
     try:
         # Analyze the campaigns
-        result = analyze_campaigns('Historic Report CA.csv')
+        result = analyze_campaigns(args.csv_file, chunksize=args.chunksize)
         
         if result is not None:
-            # Display results
-            pd.set_option('display.max_columns', None)
-            pd.set_option('display.width', None)
+            # Display results, only formatting the rows that are printed
+            display_df = result[DISPLAY_COLUMNS]
+            if not args.full:
+                display_df = display_df.head(DISPLAY_ROWS)
+            
             print("\nSorted campaigns (by cost per result and CPC):")
-            print(result[['Campaign name', 'Ad Set Name', 'Ad name', 'Cost per result', 
-                         'CPC (cost per link click)', 'Results', 'Amount spent (GBP)']])
+            print(display_df.to_string(index=False, formatters=DISPLAY_FORMATTERS))
+            if len(display_df) < len(result):
+                print(f"... showing {len(display_df)} of {len(result)} campaigns, use --full to show all")
+            
+            # Compute both averages in one reduction
+            averages = result[['Cost per result', 'CPC (cost per link click)']].mean().to_dict()
             
             print("\nAnalysis Summary:")
             print(f"Total campaigns analyzed: {len(result)}")
-            print(f"Average Cost per Result: £{result['Cost per result'].mean():.2f}")
-            print(f"Average CPC: £{result['CPC (cost per link click)'].mean():.2f}")
+            print(f"Average Cost per Result: £{averages['Cost per result']:.2f}")
+            print(f"Average CPC: £{averages['CPC (cost per link click)']:.2f}")
         else:
             print("No campaigns met the analysis criteria")
             
     except Exception as e:
-        logging.error(f"Script execution failed: {str(e)}")
+        logging.error("Script execution failed: %s", e)
 
 # Fixes #5
\ No newline at end of file